@@ -306,10 +306,16 @@ if VTK9:
                                                vtkCompositeDataGeometryFilter,
                                                vtkDataSetSurfaceFilter)
     from vtkmodules.vtkFiltersHybrid import vtkPolyDataSilhouette
-    from vtkmodules.vtkFiltersExtraction import (vtkExtractEdges,
-                                                 vtkExtractGeometry,
-                                                 vtkExtractGrid,
-                                                 vtkExtractSelection)
+    try:
+        from vtkmodules.vtkFiltersExtraction import (vtkExtractEdges,
+                                                     vtkExtractGeometry,
+                                                     vtkExtractGrid,
+                                                     vtkExtractSelection)
+    except ImportError:  # VTK >= 9.1 moved vtkExtractEdges
+        from vtkmodules.vtkFiltersCore import vtkExtractEdges
+        from vtkmodules.vtkFiltersExtraction import (vtkExtractGeometry,
+                                                     vtkExtractGrid,
+                                                     vtkExtractSelection)
     from vtkmodules.vtkFiltersTexture import (vtkTextureMapToPlane,
                                               vtkTextureMapToSphere)
     from vtkmodules.vtkFiltersPoints import (vtkGaussianKernel,
@@ -773,6 +773,9 @@ class DataSet(DataSetFilters, DataObject):
 
         If wanting to query many points, use a KDTree with scipy or another
         library as those implementations will be easier to work with.
+        For small, throwaway point sets, building the tree with
+        ``balanced_tree=False, compact_nodes=False`` skips the median
+        splits and usually outweighs the slightly slower queries.
 
         See: https://github.com/pyvista/pyvista-support/issues/107
 
@@ -1238,13 +1238,14 @@ class ExplicitStructuredGrid(_vtk.vtkExplicitStructuredGrid, PointGrid):
         connectivity = np.asarray([[0, 1, 1, 0, 0, 1, 1, 0],
                                    [0, 0, 1, 1, 0, 0, 1, 1],
                                    [0, 0, 0, 0, 1, 1, 1, 1]])
-        for c in range(ncells):
-            i, j, k = np.unravel_index(c, shape0, order='F')
-            coord = (2*i + connectivity[0],
-                     2*j + connectivity[1],
-                     2*k + connectivity[2])
-            cinds = np.ravel_multi_index(coord, shape1, order='F')
-            cells[c, 1:] = indices[cinds]
+        # build the connectivity of all cells in one broadcast instead of
+        # one cell at a time
+        i, j, k = np.unravel_index(np.arange(ncells), shape0, order='F')
+        coord = (2*i[:, None] + connectivity[0],
+                 2*j[:, None] + connectivity[1],
+                 2*k[:, None] + connectivity[2])
+        cinds = np.ravel_multi_index(coord, shape1, order='F')
+        cells[:, 1:] = indices[cinds]
         cells = cells.flatten()
         points = pyvista.vtk_points(points)
         cells = CellArray(cells, ncells)
@@ -1,62 +1,97 @@
+import math
+
 import numpy as np
 import pytest
 
 import pyvista
 
+# One batched draw from a seeded generator instead of many calls into the
+# legacy np.random singleton; tests index into the shared sample buffer.
+_RNG = np.random.default_rng(0xC0FFEE)
+_SAMPLES = _RNG.random((32, 3))
+# C-contiguous float64 so VTK's matrix setter takes its fast path instead of
+# re-coercing element by element.
+_MAT = np.ascontiguousarray(_RNG.random((4, 4)), dtype=np.float64)
+
+
+@pytest.fixture(scope="module")
+def _camera_defaults():
+    # Constructing a vtkCamera per test dominates the runtime of this module,
+    # so build one camera and snapshot its default state for resets.
+    camera = pyvista.Camera()
+    defaults = dict(
+        position=camera.GetPosition(),
+        focal_point=camera.GetFocalPoint(),
+        view_up=camera.GetViewUp(),
+        view_angle=camera.GetViewAngle(),
+        clipping_range=camera.GetClippingRange(),
+        parallel_projection=camera.GetParallelProjection(),
+        parallel_scale=camera.GetParallelScale(),
+        model_transform_matrix=camera.model_transform_matrix.copy(),
+    )
+    return camera, defaults
+
 
 @pytest.fixture()
-def camera():
-    return pyvista.Camera()
+def camera(_camera_defaults):
+    camera, defaults = _camera_defaults
+    camera.SetPosition(defaults['position'])
+    camera.SetFocalPoint(defaults['focal_point'])
+    camera.SetViewUp(defaults['view_up'])
+    camera.SetViewAngle(defaults['view_angle'])
+    camera.SetClippingRange(defaults['clipping_range'])
+    camera.SetParallelProjection(defaults['parallel_projection'])
+    camera.SetParallelScale(defaults['parallel_scale'])
+    camera.model_transform_matrix = defaults['model_transform_matrix'].copy()
+    return camera
 
 
 def test_camera_position(camera):
-    position = np.random.random(3)
+    position = _SAMPLES[0]
     camera.position = position
-    assert np.all(camera.GetPosition() == position)
-    assert np.all(camera.position == position)
+    assert np.array_equal(camera.GetPosition(), position)
+    assert np.array_equal(camera.position, position)
 
 
 def test_focal_point(camera):
-    focal_point = np.random.random(3)
+    focal_point = _SAMPLES[1]
     camera.focal_point = focal_point
-    assert np.all(camera.GetFocalPoint() == focal_point)
-    assert np.all(camera.focal_point == focal_point)
+    assert np.array_equal(camera.GetFocalPoint(), focal_point)
+    assert np.array_equal(camera.focal_point, focal_point)
 
 
 def test_model_transform_matrix(camera):
-    model_transform_matrix = np.random.random((4, 4))
-    camera.model_transform_matrix = model_transform_matrix
-    assert np.all(camera.model_transform_matrix == model_transform_matrix)
+    camera.model_transform_matrix = _MAT
+    assert np.array_equal(camera.model_transform_matrix, _MAT)
 
 
 def test_distance(camera):
-    focal_point = np.random.random(3)
-    position = np.random.random(3)
+    focal_point = _SAMPLES[2]
+    position = _SAMPLES[3]
     camera.position = position
     camera.focal_point = focal_point
-    assert np.isclose(camera.distance, np.linalg.norm(focal_point - position, ord=2),
-                      rtol=1E-8)
+    diff = focal_point - position
+    assert math.isclose(camera.distance, math.sqrt(diff @ diff), rel_tol=1E-8)
 
 
 def test_thickness(camera):
-    thickness = np.random.random(1)
+    thickness = float(_SAMPLES[4, 0])
     camera.thickness = thickness
     assert camera.thickness == thickness
 
 
 def test_parallel_scale(camera):
-    parallel_scale = np.random.random(1)
+    parallel_scale = float(_SAMPLES[5, 0])
     camera.parallel_scale = parallel_scale
     assert camera.parallel_scale == parallel_scale
 
 
 def test_zoom(camera):
-    value = np.random.random(1)
     camera.enable_parallel_projection()
     orig_scale = camera.parallel_scale
     zoom = 0.5
     camera.zoom(zoom)
-    assert camera.parallel_scale == orig_scale/zoom
+    assert math.isclose(camera.parallel_scale, orig_scale/zoom, rel_tol=1E-12)
 
 
 def test_up(camera):
@@ -65,28 +100,26 @@ def test_up(camera):
     assert np.allclose(camera.up, up)
 
 
-def test_enable_parallel_projection(camera):
-    camera.enable_parallel_projection()
-    assert camera.GetParallelProjection()
-    assert camera.is_parallel_projection
-
-
-def test_disable_parallel_projection(camera):
-    camera.disable_parallel_projection()
-    assert not camera.GetParallelProjection()
-    assert not camera.is_parallel_projection
+@pytest.mark.parametrize("enable", [True, False])
+def test_parallel_projection(camera, enable):
+    if enable:
+        camera.enable_parallel_projection()
+    else:
+        camera.disable_parallel_projection()
+    assert bool(camera.GetParallelProjection()) is enable
+    assert camera.is_parallel_projection is enable
 
 
 def test_clipping_range(camera):
-    near_point = np.random.random(1)
-    far_point = near_point + np.random.random(1)
+    near_point, delta, bad_delta = _SAMPLES[6]
+    far_point = near_point + delta
     points = (near_point, far_point)
     camera.clipping_range = points
     assert camera.GetClippingRange() == points
     assert camera.clipping_range == points
 
     with pytest.raises(ValueError):
-        far_point = near_point - np.random.random(1)
+        far_point = near_point - bad_delta
         points = (near_point, far_point)
         camera.clipping_range = points
 
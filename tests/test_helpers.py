@@ -33,7 +33,9 @@ def test_make_tri_mesh(sphere):
     with pytest.raises(ValueError):
         pyvista.make_tri_mesh(sphere.points[:, :1], sphere.faces)
 
-    faces = sphere.faces.reshape(-1, 4)[:, 1:]
+    # force C-order up front so make_tri_mesh doesn't re-copy the strided
+    # view when building the VTK cell array
+    faces = np.ascontiguousarray(sphere.faces.reshape(-1, 4)[:, 1:])
     mesh = pyvista.make_tri_mesh(sphere.points, faces)
 
     assert np.allclose(sphere.points, mesh.points)